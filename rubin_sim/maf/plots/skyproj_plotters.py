@@ -1,10 +1,11 @@
 import abc
+import functools
+import math
 import warnings
-from collections import defaultdict
+from collections import namedtuple
 from numbers import Integral
 from weakref import WeakKeyDictionary
 
-import astropy.units as u
 import healpy as hp
 import matplotlib as mpl
 import matplotlib.pyplot as plt
@@ -12,12 +13,158 @@ import numpy as np
 import numpy.ma as ma
 import pandas as pd
 import skyproj
-from astropy.coordinates import SkyCoord
+from matplotlib.collections import LineCollection, PolyCollection
 from rubin_scheduler.utils import _healbin
 
 from .plot_handler import BasePlotter, apply_zp_norm
 from .spatial_plotters import set_color_lims, set_color_map
 
+# Rotation matrix from galactic to ICRS cartesian coordinates:
+# the transpose of the ICRS to galactic matrix in ERFA's eraIcrs2g.
+_ICRS_FROM_GALACTIC = np.array(
+    [
+        [-0.054875560416215368, -0.873437090234885048, -0.483835015548713226],
+        [+0.494109427875583673, -0.444829629960011178, +0.746982244497218890],
+        [-0.867666149019004701, -0.198076373431201528, +0.455983776175066922],
+    ]
+).T
+
+# Rotation matrix from ecliptic to ICRS cartesian coordinates: a rotation
+# about the x axis by the J2000 mean obliquity of the ecliptic (IAU 2006).
+_OBLIQUITY = np.radians(84381.406 / 3600)
+_ICRS_FROM_ECLIPTIC = np.array(
+    [
+        [1.0, 0.0, 0.0],
+        [0.0, np.cos(_OBLIQUITY), -np.sin(_OBLIQUITY)],
+        [0.0, np.sin(_OBLIQUITY), np.cos(_OBLIQUITY)],
+    ]
+)
+
+
+def _pole_radec(icrs_from_frame):
+    # R.A. and Decl. (deg.) of the pole of a frame, given the rotation
+    # matrix from that frame to ICRS.
+    x, y, z = icrs_from_frame @ np.array([0.0, 0.0, 1.0])
+    return float(np.degrees(np.arctan2(y, x)) % 360), float(np.degrees(np.arcsin(z)))
+
+
+# The poles of the ecliptic and galactic coordinate systems do not move
+# in ICRS, so compute them once rather than on every decoration.
+_ECLIPTIC_POLE_RADEC = _pole_radec(_ICRS_FROM_ECLIPTIC)
+_GALACTIC_POLE_RADEC = _pole_radec(_ICRS_FROM_GALACTIC)
+
+# Normalized form of the default subplot specification, 111.
+_SUBPLOT_111 = (1, 1, 1)
+
+CirclePoints = namedtuple("CirclePoints", ["bearing", "ra", "decl"])
+
+
+def _circle_points_np(center_ra, center_decl, radius, bearings):
+    # Offset the center by radius along each bearing, using the
+    # spherical law of cosines directly rather than going through
+    # SkyCoord.directional_offset_by.
+    theta = np.radians(bearings)
+    phi0 = np.radians(center_decl)
+    lambda0 = np.radians(center_ra)
+    delta = np.radians(radius)
+    sin_phi = np.sin(phi0) * np.cos(delta) + np.cos(phi0) * np.sin(delta) * np.cos(theta)
+    phi = np.arcsin(np.clip(sin_phi, -1.0, 1.0))
+    lambdas = lambda0 + np.arctan2(
+        np.sin(theta) * np.sin(delta) * np.cos(phi0), np.cos(delta) - np.sin(phi0) * sin_phi
+    )
+    ras = np.degrees(lambdas) % 360
+    decls = np.degrees(phi)
+
+    # de-normalize RA so there are no large jumps, which can
+    # confuse cartopy + matplotlib. Rounding each step to the nearest
+    # multiple of 360 gives the adjustment without any masked selects.
+    ras[1:] -= 360.0 * np.cumsum(np.round(np.diff(ras) / 360.0))
+
+    return ras, decls
+
+
+# Circles with at least this many points are computed with numba, if it
+# is available. The compiled loop is no faster than numpy for circles
+# with fewer points (by about 10% with more), which does not make up for
+# the time needed to import numba unless circles are very finely sampled.
+_NUMBA_MIN_POINTS = 300_000
+
+
+def _circle_points_loop(center_ra, center_decl, radius, bearings):
+    # The same computation as _circle_points_np, but in a single loop
+    # that also de-normalizes the RA without temporary arrays,
+    # for compilation with numba.
+    ras = np.empty_like(bearings)
+    decls = np.empty_like(bearings)
+
+    lambda0 = math.radians(center_ra)
+    sin_phi0 = math.sin(math.radians(center_decl))
+    cos_phi0 = math.cos(math.radians(center_decl))
+    sin_delta = math.sin(math.radians(radius))
+    cos_delta = math.cos(math.radians(radius))
+
+    ra_offset = 0.0
+    previous_ra = 0.0
+    for i in range(bearings.size):
+        theta = math.radians(bearings[i])
+        sin_phi = min(max(sin_phi0 * cos_delta + cos_phi0 * sin_delta * math.cos(theta), -1.0), 1.0)
+        lambda_offset = math.atan2(math.sin(theta) * sin_delta * cos_phi0, cos_delta - sin_phi0 * sin_phi)
+        ra = math.degrees(lambda0 + lambda_offset) % 360
+        if i > 0:
+            if ra - previous_ra > 180:
+                ra_offset -= 360.0
+            elif ra - previous_ra < -180:
+                ra_offset += 360.0
+        previous_ra = ra
+        ras[i] = ra + ra_offset
+        decls[i] = math.degrees(math.asin(sin_phi))
+
+    return ras, decls
+
+
+@functools.cache
+def _jitted_circle_points():
+    # Import numba only when a circle is large enough to need it, so
+    # that plots with only default decorations do not pay for it.
+    try:
+        import numba
+    except ImportError:
+        return None
+
+    return numba.njit(cache=True, fastmath=True)(_circle_points_loop)
+
+
+def _circle_points(center_ra, center_decl, radius, bearings):
+    if bearings.size >= _NUMBA_MIN_POINTS:
+        circle_points_nb = _jitted_circle_points()
+        if circle_points_nb is not None:
+            return circle_points_nb(center_ra, center_decl, radius, bearings)
+
+    return _circle_points_np(center_ra, center_decl, radius, bearings)
+
+
+@functools.lru_cache(maxsize=256)
+def _circle_arrays(center_ra, center_decl, radius, start_bear, end_bear, step):
+    # Points along a circle, as read-only arrays so that the cached
+    # values cannot be modified by callers.
+    # Use linspace rather than arange, so the number of points and the
+    # last bearing do not depend on floating point rounding.
+    num_points = int(round((end_bear - start_bear) / step)) + 1
+    bearings = np.linspace(start_bear, end_bear, num_points, dtype=float)
+    ras, decls = _circle_points(float(center_ra), float(center_decl), float(radius), bearings)
+
+    for values in (bearings, ras, decls):
+        values.flags.writeable = False
+
+    return CirclePoints(bearings, ras, decls)
+
+
+def _compute_circle_points(center_ra, center_decl, radius=90.0, start_bear=0, end_bear=360, step=1):
+    # Round the center so that nearly identical circles share cache entries.
+    return _circle_arrays(
+        round(float(center_ra), 6), round(float(center_decl), 6), radius, start_bear, end_bear, step
+    )
+
 
 def compute_circle_points(
     center_ra,
@@ -42,41 +189,31 @@ def compute_circle_points(
     end_bear : int, optional
         Bearing (E. of N.) of the end of the circle (deg.), by default 360
     step : int, optional
-        Spacing of the points along the circle (deg.), by default 1
+        Spacing of the points along the circle (deg.), by default 1.
+        If ``end_bear - start_bear`` is not a multiple of ``step``, the
+        spacing is adjusted so that the points end exactly at ``end_bear``.
 
     Returns
     -------
     circle : `pandas.DataFrame`
         DataFrame with points in the circle.
-    """
-    ras = []
-    decls = []
-
-    bearing_angles = np.arange(start_bear, end_bear + step, step) * u.deg
-    center_coords = SkyCoord(center_ra * u.deg, center_decl * u.deg)
-    circle_coords = center_coords.directional_offset_by(bearing_angles, radius * u.deg)
-    bearings = bearing_angles.value.tolist()
-    ras = circle_coords.ra.deg.tolist()
-    decls = circle_coords.dec.deg.tolist()
 
-    # de-normalize RA so there are no large jumps, which can
-    # confuse cartopy + matplotlib
-
-    previous_ra = ras[0]
-    for ra_index in range(1, len(ras)):
-        if ras[ra_index] - previous_ra > 180:
-            ras[ra_index] -= 360
-        if ras[ra_index] - previous_ra < -180:
-            ras[ra_index] += 360
-        previous_ra = ras[ra_index]
+    Notes
+    -----
+    Results are cached on the center rounded to 1e-6 degrees, so repeated
+    decorations with the same circle do not recompute the points.
+    If ``numba`` is installed, very finely sampled circles (``step``
+    of about 0.001 deg. or less) are computed with a compiled loop.
+    """
+    points = _compute_circle_points(center_ra, center_decl, radius, start_bear, end_bear, step)
 
     circle = pd.DataFrame(
         {
-            "bearing": bearings,
-            "ra": ras,
-            "decl": decls,
-        }
-    ).set_index("bearing")
+            "ra": points.ra,
+            "decl": points.decl,
+        },
+        index=pd.Index(points.bearing, name="bearing"),
+    )
 
     return circle
 
@@ -89,6 +226,18 @@ class SkyprojPlotter(BasePlotter, abc.ABC):
     # and when it is entry in the dictionary automatically deleted.
     skyproj_instances = WeakKeyDictionary()
 
+    # For each figure and subplot in skyproj_instances, the lines and
+    # collections present once the projection was set up (boundary,
+    # graticule, etc.), which are kept when the axes are reused.
+    skyproj_setup_artists = WeakKeyDictionary()
+
+    # Cache the conditions and sun and moon positions used by decorations,
+    # so that decorations in the same figure (or other figures made with
+    # the same model observatory at the same time) share a single lookup.
+    # Keys are model observatories, values dicts keyed by "mjd" and the
+    # cached quantities.
+    observatory_caches = WeakKeyDictionary()
+
     default_decorations = ["ecliptic", "galactic_plane"]
 
     default_colorbar_kwargs = {
@@ -105,6 +254,9 @@ class SkyprojPlotter(BasePlotter, abc.ABC):
     moon_kwargs = {"color": "orange"}
     horizon_kwargs = {"edgecolor": "black", "linewidth": 3}
 
+    # Keyword arguments of circles that can be drawn in a LineCollection
+    _circle_collection_keys = {"edgecolor", "linestyle", "linewidth"}
+
     def __init__(self):
         super().__init__()
         # Customize our plotters members for our new plot
@@ -129,11 +281,9 @@ class SkyprojPlotter(BasePlotter, abc.ABC):
         self.figure = None
 
     def _initialize_plot_dict(self, user_plot_dict):
-        # Use a defaultdict so that everything not explicitly set return None.
-        def return_none():
-            return None
-
-        self.plot_dict = defaultdict(return_none)
+        # Optional elements not explicitly set should be read with
+        # self.plot_dict.get, so they return None.
+        self.plot_dict = {}
         self.plot_dict.update(self.default_plot_dict)
         self.plot_dict.update(user_plot_dict)
 
@@ -148,19 +298,30 @@ class SkyprojPlotter(BasePlotter, abc.ABC):
         # This is needed so that the same subplot set by different ways will be
         # stored in the same key in the instance dictionary.
         subplot_in = self.plot_dict["subplot"]
-        in_integral_form = isinstance(subplot_in, Integral) and len(str(subplot_in)) == 3
-        subplot = tuple(map(int, str(subplot_in))) if in_integral_form else tuple(subplot_in)
+        if isinstance(subplot_in, Integral) and subplot_in == 111:
+            subplot = _SUBPLOT_111
+        else:
+            in_integral_form = isinstance(subplot_in, Integral) and 100 <= subplot_in <= 999
+            if in_integral_form:
+                nrows, index_digits = divmod(int(subplot_in), 100)
+                ncols, index = divmod(index_digits, 10)
+                subplot = (nrows, ncols, index)
+            else:
+                subplot = tuple(subplot_in)
 
         # If there is an existing instance of SkyprojPlotter (or one of its
         # subclasses), reuse it.
         # Otherwise, create a new one and store it so that it may be reused.
         if self.figure not in self.skyproj_instances:
             self.skyproj_instances[self.figure] = {}
+            self.skyproj_setup_artists[self.figure] = {}
 
         if subplot in self.skyproj_instances[self.figure]:
             existing_instance = self.skyproj_instances[self.figure][subplot]
             assert isinstance(existing_instance, self.plot_dict["skyproj"])
             self.skyproj = existing_instance
+            if self.plot_dict.get("reuse_axes"):
+                self._clear_data_artists(self.skyproj_setup_artists[self.figure][subplot])
         else:
             # This instance of Axis will get deleted and replaced when the
             # corresponding SkyPlot class is created, but this instances is
@@ -169,6 +330,66 @@ class SkyprojPlotter(BasePlotter, abc.ABC):
             ax = self.figure.add_subplot(*subplot)
             self.skyproj = self.plot_dict["skyproj"](ax=ax, **self.plot_dict["skyproj_kwargs"])
             self.skyproj_instances[self.figure][subplot] = self.skyproj
+            self.skyproj_setup_artists[self.figure][subplot] = set(self.skyproj.ax.collections) | set(
+                self.skyproj.ax.lines
+            )
+
+    def _clear_data_artists(self, setup_artists):
+        # Remove everything drawn on the axes after the projection was set
+        # up, so it can be redrawn without rebuilding the projection.
+        # skyproj (as of version 2.6) replaces its boundary lines whenever
+        # the extent changes (e.g. when zooming to a map), and removes the
+        # old ones itself, so the current ones must be kept along with
+        # those from the setup.
+        skyproj_artists = set(setup_artists) | set(self.skyproj._boundary_lines or [])
+        reusable_artists = self._reusable_artists()
+        for artist in list(self.skyproj.ax.collections) + list(self.skyproj.ax.lines):
+            if artist in skyproj_artists:
+                continue
+            # Remove any colorbar before its mappable, so that the axes
+            # get their space back.
+            colorbar = getattr(artist, "colorbar", None)
+            if colorbar is not None:
+                colorbar.remove()
+            if artist not in reusable_artists:
+                artist.remove()
+
+        if len(reusable_artists) == 0:
+            self._forget_skyproj_map()
+
+    def _forget_skyproj_map(self):
+        # skyproj (as of version 2.6) records the last map drawn in
+        # Skyproj._redraw_dict, and redraws it, removing the mesh from any
+        # earlier redraw, whenever the extent changes. Forget the map once
+        # it has been cleared, so that skyproj neither draws it again nor
+        # tries to remove a mesh that is no longer on the axes.
+        self.skyproj._redraw_dict.update({"hpxmap": None, "hspmap": None, "im": None})
+
+    def _reusable_artists(self):
+        # Artists that draw may update in place rather than redraw, and so
+        # should be kept when the axes are reused.
+        return set()
+
+    def _observatory_cache(self, model_observatory):
+        # Return the cache of values for the current time of the
+        # model observatory, clearing it if the time has changed.
+        cache = self.observatory_caches.get(model_observatory)
+        if cache is None or cache["mjd"] != model_observatory.mjd:
+            cache = {"mjd": model_observatory.mjd}
+            self.observatory_caches[model_observatory] = cache
+        return cache
+
+    def _conditions(self, model_observatory):
+        cache = self._observatory_cache(model_observatory)
+        if "conditions" not in cache:
+            cache["conditions"] = model_observatory.return_conditions()
+        return cache["conditions"]
+
+    def _sun_moon_positions(self, model_observatory):
+        cache = self._observatory_cache(model_observatory)
+        if "sun_moon_positions" not in cache:
+            cache["sun_moon_positions"] = model_observatory.almanac.get_sun_moon_positions(cache["mjd"])
+        return cache["sun_moon_positions"]
 
     def draw_circle(self, center_ra, center_decl, radius=90, **kwargs):
         """Draw a circle on the sphere.
@@ -185,7 +406,7 @@ class SkyprojPlotter(BasePlotter, abc.ABC):
             Additional keyword arguments passed to
             `skyproj._Skyproj.draw_polygon`.
         """
-        points = compute_circle_points(center_ra, center_decl, radius)
+        points = _compute_circle_points(center_ra, center_decl, radius)
         self.skyproj.draw_polygon(points.ra, points.decl, **kwargs)
 
     def draw_ecliptic(self):
@@ -197,8 +418,11 @@ class SkyprojPlotter(BasePlotter, abc.ABC):
             Keyword arguments passed to
             `skyproj._Skyproj.draw_polygon`.
         """
-        ecliptic_pole = SkyCoord(lon=0 * u.degree, lat=90 * u.degree, frame="geocentricmeanecliptic").icrs
-        self.draw_circle(ecliptic_pole.ra.deg, ecliptic_pole.dec.deg, **self.ecliptic_kwargs)
+        center_ra, center_decl, radius, kwargs = self._ecliptic_circle()
+        self.draw_circle(center_ra, center_decl, radius, **kwargs)
+
+    def _ecliptic_circle(self):
+        return (*_ECLIPTIC_POLE_RADEC, 90, self.ecliptic_kwargs)
 
     def draw_galactic_plane(self):
         """Draw the galactic plane the sphere.
@@ -209,8 +433,11 @@ class SkyprojPlotter(BasePlotter, abc.ABC):
             Keyword arguments passed to
             `skyproj._Skyproj.draw_polygon`.
         """
-        galactic_pole = SkyCoord(l=0 * u.degree, b=90 * u.degree, frame="galactic").icrs
-        self.draw_circle(galactic_pole.ra.deg, galactic_pole.dec.deg, **self.galactic_plane_kwargs)
+        center_ra, center_decl, radius, kwargs = self._galactic_plane_circle()
+        self.draw_circle(center_ra, center_decl, radius, **kwargs)
+
+    def _galactic_plane_circle(self):
+        return (*_GALACTIC_POLE_RADEC, 90, self.galactic_plane_kwargs)
 
     def draw_zd(self, zd=90, **kwargs):
         """Draw a circle at a given zenith distance.
@@ -231,14 +458,22 @@ class SkyprojPlotter(BasePlotter, abc.ABC):
         should be of the class
         `rubin_scheduler.scheduler.model_observatory.ModelObservatory`.
         """
-        if "model_observatory" not in self.plot_dict or self.plot_dict["model_observatory"] is None:
-            warnings.warn("plot_dict['model_observatory'] must be set to plot a zenith distance circle")
-            return
+        circle = self._zd_circle(zd, kwargs)
+        if circle is not None:
+            center_ra, center_decl, radius, kwargs = circle
+            self.draw_circle(center_ra, center_decl, radius, **kwargs)
+
+    def _zd_circle(self, zd, kwargs):
+        # The center, radius, and keyword arguments of the circle at a
+        # zenith distance, or None if there is no model observatory.
+        model_observatory = self.plot_dict.get("model_observatory")
+        if model_observatory is None:
+            self._warn_no_observatory("a zenith distance circle")
+            return None
 
-        model_observatory = self.plot_dict["model_observatory"]
-        lmst = model_observatory.return_conditions().lmst * 360 / 24
+        lmst = self._conditions(model_observatory).lmst * 360 / 24
         latitude = model_observatory.location.lat.deg
-        self.draw_circle(lmst, latitude, zd, **kwargs)
+        return lmst, latitude, zd, kwargs
 
     def draw_body(self, body="sun", **kwargs):
         """Mark the sun or moon.
@@ -259,16 +494,99 @@ class SkyprojPlotter(BasePlotter, abc.ABC):
         should be of the class
         `rubin_scheduler.scheduler.model_observatory.ModelObservatory`.
         """
-        if "model_observatory" not in self.plot_dict or self.plot_dict["model_observatory"] is None:
-            warnings.warn(f"plot_dict['model_observatory'] must be set to plot the {body}")
-            return
+        point = self._body_point(body, kwargs)
+        if point is not None:
+            ra, decl, kwargs = point
+            self.skyproj.scatter(ra, decl, **kwargs)
+
+    def _body_point(self, body, kwargs):
+        # R.A. and Decl. of the sun or moon, and the keyword arguments to
+        # mark it with, or None if there is no model observatory.
+        model_observatory = self.plot_dict.get("model_observatory")
+        if model_observatory is None:
+            self._warn_no_observatory(f"the {body}")
+            return None
 
-        mjd = self.plot_dict["model_observatory"].mjd
-        model_observatory = self.plot_dict["model_observatory"]
-        sun_moon_positions = model_observatory.almanac.get_sun_moon_positions(mjd)
+        sun_moon_positions = self._sun_moon_positions(model_observatory)
         ra = np.degrees(sun_moon_positions[f"{body}_RA"].item())
         decl = np.degrees(sun_moon_positions[f"{body}_dec"].item())
-        self.skyproj.scatter(ra, decl, **kwargs)
+        return ra, decl, kwargs
+
+    def _warn_no_observatory(self, decoration):
+        warnings.warn(f"plot_dict['model_observatory'] must be set to plot {decoration}")
+
+    def draw_circles(self, circles):
+        """Draw several circles on the sphere with a single artist.
+
+        Parameters
+        ----------
+        circles : `list` [`tuple`]
+            The circles to draw, each a tuple of the R.A. (deg.) and
+            Decl. (deg.) of the center, the radius (deg.), and a `dict`
+            of keyword arguments as accepted by
+            `skyproj._Skyproj.draw_polygon`.
+
+        Notes
+        -----
+        Circles are combined into one
+        `matplotlib.collections.LineCollection` if their keyword
+        arguments are limited to ``edgecolor``, ``linestyle``, and
+        ``linewidth``; any others are drawn individually with
+        `draw_circle`.
+        """
+        segments = []
+        colors = []
+        linestyles = []
+        linewidths = []
+        for center_ra, center_decl, radius, kwargs in circles:
+            edgecolor = kwargs.get("edgecolor", "red")
+            linestyle = kwargs.get("linestyle", "solid")
+            if edgecolor is None or linestyle is None or not set(kwargs) <= self._circle_collection_keys:
+                self.draw_circle(center_ra, center_decl, radius, **kwargs)
+                continue
+
+            points = _compute_circle_points(center_ra, center_decl, radius)
+            segments.append(np.column_stack([points.ra, points.decl]))
+            colors.append(edgecolor)
+            linestyles.append(linestyle)
+            linewidths.append(kwargs.get("linewidth", mpl.rcParams["lines.linewidth"]))
+
+        if len(segments) > 0:
+            circle_lines = LineCollection(
+                segments, colors=colors, linestyles=linestyles, linewidths=linewidths
+            )
+            self.skyproj.ax.add_collection(circle_lines)
+
+    def draw_points(self, points):
+        """Mark several points on the sphere with a single scatter plot.
+
+        Parameters
+        ----------
+        points : `list` [`tuple`]
+            The points to mark, each a tuple of the R.A. (deg.) and
+            Decl. (deg.) of the point and a `dict` of keyword arguments
+            passed to `skyproj._Skyproj.scatter`.
+
+        Notes
+        -----
+        Points are combined into a single scatter plot if they all set
+        ``color`` and their other keyword arguments are the same;
+        otherwise each is marked separately.
+        """
+        if len(points) == 0:
+            return
+
+        ras, decls, kwargs_list = zip(*points)
+        common_kwargs = [{k: v for k, v in kwargs.items() if k != "color"} for kwargs in kwargs_list]
+        batchable = all("color" in kwargs for kwargs in kwargs_list) and all(
+            kwargs == common_kwargs[0] for kwargs in common_kwargs
+        )
+        if batchable:
+            colors = [kwargs["color"] for kwargs in kwargs_list]
+            self.skyproj.scatter(np.array(ras), np.array(decls), color=colors, **common_kwargs[0])
+        else:
+            for ra, decl, kwargs in points:
+                self.skyproj.scatter(ra, decl, **kwargs)
 
     def decorate(self):
         """Add decorations/annotations to the sky plot.
@@ -283,23 +601,39 @@ class SkyprojPlotter(BasePlotter, abc.ABC):
         `rubin_scheduler.scheduler.model_observatory.ModelObservatory`.
         Other decorations (e.g., the ecliptic and galactic plane) can
         be shown even when ``model_observatory`` is not set.
+
+        The circles (the ecliptic, galactic plane, and horizon) and the
+        points (the sun and moon) are each drawn together, with
+        `draw_circles` and `draw_points`, rather than with `draw_ecliptic`,
+        `draw_galactic_plane`, `draw_zd`, and `draw_body`, so overriding
+        those methods does not change the decorations. Their styles are
+        set by the ``ecliptic_kwargs``, ``galactic_plane_kwargs``,
+        ``horizon_kwargs``, ``sun_kwargs``, and ``moon_kwargs`` attributes.
         """
         decorations = self.plot_dict["decorations"]
 
+        circles = []
+
         if "ecliptic" in decorations:
-            self.draw_ecliptic()
+            circles.append(self._ecliptic_circle())
 
         if "galactic_plane" in decorations:
-            self.draw_galactic_plane()
+            circles.append(self._galactic_plane_circle())
+
+        if "horizon" in decorations:
+            circles.append(self._zd_circle(90, self.horizon_kwargs))
+
+        points = []
 
         if "sun" in decorations:
-            self.draw_body("sun", **self.sun_kwargs)
+            points.append(self._body_point("sun", self.sun_kwargs))
 
         if "moon" in decorations:
-            self.draw_body("moon", **self.moon_kwargs)
+            points.append(self._body_point("moon", self.moon_kwargs))
 
-        if "horizon" in decorations:
-            self.draw_zd(**self.horizon_kwargs)
+        # Decorations that need a model observatory are None without one.
+        self.draw_circles([circle for circle in circles if circle is not None])
+        self.draw_points([point for point in points if point is not None])
 
     @abc.abstractmethod
     def draw(self, metric_values, slicer):
@@ -325,6 +659,16 @@ class SkyprojPlotter(BasePlotter, abc.ABC):
         -------
         fig : `matplotlib.figure.Figure`
            Figure with the plot.
+
+        Notes
+        -----
+        If ``fig`` already has a sky projection in the requested subplot,
+        it is reused and the new plot is drawn over what is already there.
+        If ``user_plot_dict["reuse_axes"]`` is ``True``, the data and
+        decorations previously drawn on that projection (but not the
+        projection itself, its boundary, or its graticule) are removed
+        first, which is much faster than making a new figure when
+        repeatedly re-rendering updated metric values.
         """
         self._initialize_plot_dict(user_plot_dict)
         self._prepare_skyproj(fig)
@@ -339,7 +683,7 @@ class SkyprojPlotter(BasePlotter, abc.ABC):
         else:
             self.skyproj.ax.set_xlabel(self.plot_dict["xlabel"])
 
-        if self.plot_dict["ylabel"] is None:
+        if self.plot_dict.get("ylabel") is None:
             if "ylabel" not in self.plot_dict["decorations"]:
                 self.skyproj.ax.set_ylabel("", visible=False)
         else:
@@ -368,7 +712,22 @@ class HpxmapPlotter(SkyprojPlotter):
     def __init__(self):
         super().__init__()
         self.default_plot_dict["colorbar"] = True
+        # set_color_map and set_color_lims expect these to be present.
+        self.default_plot_dict.update(
+            {
+                "cmap": None,
+                "color_min": None,
+                "color_max": None,
+                "percentile_clip": None,
+            }
+        )
         self.object_plotter = False
+        # The requested cmap and the colormap made from it by set_color_map
+        self._cmap_cache = None
+        # The mesh drawn by draw_hpxmap, the healpix pixel shown in each
+        # of its cells, and what determined that mapping, for use when
+        # redrawing with reuse_axes.
+        self._hpxmap_raster_cache = None
 
     def draw_colorbar(self):
         """Add a color bar."""
@@ -399,16 +758,16 @@ class HpxmapPlotter(SkyprojPlotter):
 
         colorbar.set_label(self.plot_dict["xlabel"], fontsize=self.plot_dict["fontsize"])
 
-        if "labelsize" in self.plot_dict and self.plot_dict["labelsize"] is not None:
+        if self.plot_dict.get("labelsize") is not None:
             colorbar.ax.tick_params(labelsize=plot_dict["labelsize"])
 
-        if "n_ticks" in self.plot_dict and self.plot_dict["n_ticks"] is not None:
+        if self.plot_dict.get("n_ticks") is not None:
             tick_locator = mpl.ticker.MaxNLocator(nbins=plot_dict["n_ticks"])
             colorbar.locator = tick_locator
             colorbar.update_ticks()
 
         # If outputing to PDF, this fixes the colorbar white stripes
-        if "cbar_edge" in self.plot_dict and self.plot_dict["cbar_edge"]:
+        if self.plot_dict.get("cbar_edge"):
             colorbar.solids.set_edgecolor("face")
 
     def decorate(self):
@@ -423,8 +782,8 @@ class HpxmapPlotter(SkyprojPlotter):
             slicer.slice_points["ra"],
             slicer.slice_points["dec"],
             metric_value_in.filled(slicer.badval),
-            nside=self.plot_dict["nside"],
-            reduce_func=self.plot_dict["reduce_func"],
+            nside=self.plot_dict.get("nside"),
+            reduce_func=self.plot_dict.get("reduce_func"),
             fill_val=slicer.badval,
         )
         mask = np.zeros(metric_value.size)
@@ -438,6 +797,19 @@ class HpxmapPlotter(SkyprojPlotter):
         compatible = (norm != "log") or (clims[0] < 0 and clims[1] < 0) or (clims[0] > 0 and clims[1] > 0)
         return compatible
 
+    def _color_map(self):
+        # set_color_map copies and modifies the colormap, so reuse its
+        # result while the requested colormap stays the same.
+        cmap = self.plot_dict.get("cmap")
+        if self._cmap_cache is not None:
+            cached_cmap = self._cmap_cache[0]
+            if cmap is cached_cmap or (isinstance(cmap, str) and cmap == cached_cmap):
+                return self._cmap_cache[1]
+
+        color_map = set_color_map(self.plot_dict)
+        self._cmap_cache = (cmap, color_map)
+        return color_map
+
     def draw(self, metric_values_in, slicer):
         """Draw the healpix map.
 
@@ -447,6 +819,13 @@ class HpxmapPlotter(SkyprojPlotter):
             The metric values from the bundle.
         slicer : `rubin_sim.maf.slicers.TwoDSlicer`
             The slicer
+
+        Notes
+        -----
+        If ``plot_dict["reuse_axes"]`` is ``True`` and the previous map
+        drawn on these axes had the same ``nside``, extent, and
+        ``draw_hpxmap_kwargs`` (without zooming), the values in the
+        existing mesh are replaced instead of rasterizing the map again.
         """
         kwargs = {}
         kwargs.update(self.default_hpixmap_kwargs)
@@ -463,12 +842,12 @@ class HpxmapPlotter(SkyprojPlotter):
             kwargs.update(self.plot_dict["draw_hpxmap_kwargs"])
 
         try:
-            kwargs["cmap"] = set_color_map(self.plot_dict)
+            kwargs["cmap"] = self._color_map()
         except AttributeError:
             # Probably here because an invalid cmap was set
             pass
 
-        if self.plot_dict["log_scale"]:
+        if self.plot_dict.get("log_scale"):
             if "norm" in kwargs and kwargs["norm"] != "log":
                 raise ValueError("Contradictory values for color scale normalization set.")
             kwargs["norm"] = "log"
@@ -489,19 +868,99 @@ class HpxmapPlotter(SkyprojPlotter):
         # This masking replicates the behavior of HealpixSkyMap, but is it
         # what we really want to do? Why not use the default handling of
         # masked values applied by skyproj?
-        if "mask_below" in self.plot_dict and self.plot_dict["mask_below"] is not None:
+        if self.plot_dict.get("mask_below") is not None:
             to_mask = np.where(hpix_map <= self.plot_dict["mask_below"])[0]
             hpix_map.mask[to_mask] = True
             hpix_map = hpix_map.filled(hp.UNSEEN)
         else:
             hpix_map = hpix_map.filled(slicer.badval)
 
-        self.skyproj.draw_hpxmap(hpix_map, **kwargs)
+        raster_key = self._hpxmap_raster_key(hpix_map, kwargs)
+        if self.plot_dict.get("reuse_axes") and self._recolor_hpxmap(hpix_map, kwargs, raster_key):
+            return
+
+        self._remove_cached_mesh()
+        mesh, lon_raster, lat_raster, values_raster = self.skyproj.draw_hpxmap(hpix_map, **kwargs)
+
+        if self.plot_dict.get("reuse_axes") and raster_key is not None:
+            # Find the healpix pixel at the center of each mesh cell,
+            # as draw_hpxmap does, so later maps can be recolored.
+            center_lon = (lon_raster[1:, 1:] + lon_raster[:-1, :-1]) / 2.0
+            center_lat = (lat_raster[1:, 1:] + lat_raster[:-1, :-1]) / 2.0
+            pix_raster = hp.ang2pix(
+                raster_key[0], center_lon, center_lat, nest=kwargs.get("nest", False), lonlat=True
+            )
+            # Besides the pixels without data, the mesh masks the cells
+            # where the projection wraps, which must stay masked.
+            wrap_mask = ma.getmaskarray(mesh.get_array()) & ~ma.getmaskarray(values_raster)
+            # draw_hpxmap may have changed the extent, so get the key again.
+            self._hpxmap_raster_cache = {
+                "key": self._hpxmap_raster_key(hpix_map, kwargs),
+                "mesh": mesh,
+                "pix_raster": pix_raster,
+                "wrap_mask": wrap_mask,
+            }
+
+    def _hpxmap_raster_key(self, hpix_map, kwargs):
+        # Everything that determines which healpix pixel falls in each
+        # cell of the mesh drawn by draw_hpxmap, or None if the mapping
+        # depends on the data (when zooming to the valid pixels).
+        if kwargs.get("zoom", True):
+            return None
+        mesh_kwargs = {k: v for k, v in kwargs.items() if k not in ("cmap", "vmin", "vmax")}
+        return hp.npix2nside(hpix_map.size), mesh_kwargs, tuple(self.skyproj.get_extent())
+
+    def _reusable_artists(self):
+        if self._hpxmap_raster_cache is None:
+            return set()
+        return {self._hpxmap_raster_cache["mesh"]}
+
+    def _remove_cached_mesh(self):
+        if self._hpxmap_raster_cache is not None:
+            mesh = self._hpxmap_raster_cache["mesh"]
+            if mesh.axes is self.skyproj.ax and self.plot_dict.get("reuse_axes"):
+                mesh.remove()
+                self._forget_skyproj_map()
+            self._hpxmap_raster_cache = None
+
+    def _recolor_hpxmap(self, hpix_map, kwargs, raster_key):
+        # Update the values in the mesh from the previous draw rather than
+        # rasterizing the map again, if the mapping from healpix pixels to
+        # mesh cells is unchanged. Returns whether the mesh was updated.
+        # This updates the private state that skyproj.draw_hpxmap sets
+        # (as of skyproj 2.6), so falls back to a full redraw without it.
+        cache = self._hpxmap_raster_cache
+        if (
+            not hasattr(self.skyproj, "_redraw_dict")
+            or cache is None
+            or raster_key is None
+            or cache["mesh"].axes is not self.skyproj.ax
+            or cache["key"] != raster_key
+            or kwargs.get("vmin") is None
+            or kwargs.get("vmax") is None
+        ):
+            return False
+
+        values = hpix_map[cache["pix_raster"]]
+        mask = np.isclose(values, hp.UNSEEN) | np.isnan(values) | cache["wrap_mask"]
+        mesh = cache["mesh"]
+        mesh.set_array(ma.array(values, mask=mask))
+        if "cmap" in kwargs:
+            mesh.set_cmap(kwargs["cmap"])
+        mesh.set_clim(kwargs["vmin"], kwargs["vmax"])
+
+        # As draw_hpxmap does, make the mesh the current image, and keep
+        # skyproj's record of the map current, so that it rasterizes the
+        # new values if the plot is zoomed.
+        self.skyproj.ax._sci(mesh)
+        self.skyproj._redraw_dict.update({"hpxmap": hpix_map, "vmin": kwargs["vmin"], "vmax": kwargs["vmax"]})
+        return True
 
 
 class VisitPerimeterPlotter(SkyprojPlotter):
     default_visits_kwargs = {
         "edgecolor": "black",
+        "facecolor": "none",
         "linewidth": 0.2,
     }
 
@@ -519,6 +978,21 @@ class VisitPerimeterPlotter(SkyprojPlotter):
             The metric values from the bundle.
         slicer : `rubin_sim.maf.slicers.TwoDSlicer`
             The slicer
+
+        Notes
+        -----
+        ``plot_dict["camera_perimeter_func"]`` must be a callable that
+        takes arrays of R.A., declination, and rotation (all in degrees)
+        of the visits and returns a tuple of two arrays, the R.A. and
+        declination (deg.) of the vertices of each perimeter, each with
+        shape ``(n_visits, n_vertices)``.
+
+        The perimeters are drawn as a single
+        `matplotlib.collections.PolyCollection`, so
+        ``plot_dict["draw_polygon_kwargs"]`` should contain keyword
+        arguments accepted by that class. As with
+        `skyproj.Skyproj.draw_polygon`, a ``facecolor`` or ``edgecolor``
+        of `None` means no fill or no boundary, respectively.
         """
 
         # If there are no visits, just return
@@ -533,8 +1007,30 @@ class VisitPerimeterPlotter(SkyprojPlotter):
         if "draw_polygon_kwargs" in self.plot_dict:
             kwargs.update(self.plot_dict["draw_polygon_kwargs"])
 
+        # PolyCollection uses the default color for None, where
+        # draw_polygon would leave the polygon unfilled or unbounded.
+        for color_key in ("facecolor", "edgecolor"):
+            if color_key in kwargs and kwargs[color_key] is None:
+                kwargs[color_key] = "none"
+
         camera_perimeter_func = self.plot_dict["camera_perimeter_func"]
 
         ras, decls = camera_perimeter_func(visits["fieldRA"], visits["fieldDec"], visits["rotSkyPos"])
-        for visit_ras, visit_decls in zip(ras, decls):
-            self.skyproj.draw_polygon(visit_ras, visit_decls, **kwargs)
+        # Copy the R.A. so it can be de-normalized in place.
+        ras = np.array(ras, dtype=float, order="C")
+        decls = np.ascontiguousarray(decls, dtype=float)
+        if ras.ndim != 2 or ras.shape != decls.shape:
+            raise ValueError(
+                "camera_perimeter_func must return R.A. and declination arrays "
+                "with shape (n_visits, n_vertices)."
+            )
+
+        # de-normalize RA within each perimeter so there are no large jumps
+        ras[:, 1:] -= 360.0 * np.cumsum(np.round(np.diff(ras, axis=1) / 360.0), axis=1)
+
+        # Add all perimeters as a single collection rather than one artist
+        # per visit. The skyproj axes transforms the vertices from R.A.
+        # and declination, following geodesics and splitting polygons
+        # that cross the edge of the projection, as draw_polygon does.
+        perimeters = PolyCollection(np.stack([ras, decls], axis=-1), **kwargs)
+        self.skyproj.ax.add_collection(perimeters)
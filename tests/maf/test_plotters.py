@@ -1,11 +1,18 @@
 # imports
 import unittest
+from types import SimpleNamespace
+from unittest import mock
 
+import astropy.units as u
 import numpy as np
+from astropy.coordinates import SkyCoord
+from matplotlib.collections import LineCollection, PathCollection, QuadMesh
+from matplotlib.colors import to_rgba_array
 from matplotlib.figure import Figure
 from rubin_scheduler.scheduler.model_observatory import ModelObservatory
 
 import rubin_sim.maf as maf
+from rubin_sim.maf.plots.skyproj_plotters import _circle_points_loop, _circle_points_np
 
 
 class TestPlotters(unittest.TestCase):
@@ -76,6 +83,68 @@ class TestPlotters(unittest.TestCase):
         bundle.set_plot_funcs([plotter])
         _ = bundle.plot()
 
+    def test_hpxmap_plotter_reuse_axes(self):
+        nside = 16
+        slicer = maf.HealpixSlicer(nside=nside, verbose=False)
+        # Both the full sky, and a range that wraps around the edge of the
+        # projection and sets the extent.
+        hpxmap_kwargs_list = [
+            {},
+            {"zoom": False, "lon_range": [100, 260], "lat_range": [-60, 60]},
+        ]
+        for hpxmap_kwargs in hpxmap_kwargs_list:
+            with self.subTest(draw_hpxmap_kwargs=hpxmap_kwargs):
+                plotter = maf.HpxmapPlotter()
+                plot_dict = {"reuse_axes": True, "draw_hpxmap_kwargs": hpxmap_kwargs}
+
+                metric_values = np.ma.MaskedArray(self.rng.uniform(size=len(slicer)), mask=False)
+                fig = plotter(metric_values, slicer, plot_dict)
+                num_axes = len(fig.axes)
+                num_collections = len(plotter.skyproj.ax.collections)
+                mesh = plotter.skyproj.ax.collections[0]
+
+                # Redraw on the same axes, which should recolor the map
+                # and replace rather than add the decorations and colorbar.
+                metric_values = np.ma.MaskedArray(2 + self.rng.uniform(size=len(slicer)), mask=False)
+                metric_values.mask[: len(slicer) // 4] = True
+                fig = plotter(metric_values, slicer, plot_dict, fig=fig)
+                self.assertEqual(len(fig.axes), num_axes)
+                self.assertEqual(len(plotter.skyproj.ax.collections), num_collections)
+                self.assertIs(plotter.skyproj.ax.collections[0], mesh)
+                self.assertGreaterEqual(mesh.get_clim()[0], 2)
+
+                # The recolored map should match a new one.
+                fresh_plotter = maf.HpxmapPlotter()
+                _ = fresh_plotter(metric_values, slicer, plot_dict)
+                fresh_mesh = fresh_plotter.skyproj.ax.collections[0]
+                np.testing.assert_array_equal(
+                    np.ma.getmaskarray(mesh.get_array()), np.ma.getmaskarray(fresh_mesh.get_array())
+                )
+                np.testing.assert_array_equal(
+                    mesh.get_array().compressed(), fresh_mesh.get_array().compressed()
+                )
+                self.assertEqual(mesh.get_clim(), fresh_mesh.get_clim())
+
+    def test_hpxmap_plotter_reuse_axes_zoom(self):
+        nside = 16
+        slicer = maf.HealpixSlicer(nside=nside, verbose=False)
+        plotter = maf.HpxmapPlotter()
+        plot_dict = {"reuse_axes": True, "draw_hpxmap_kwargs": {"zoom": True}}
+
+        # Alternate between maps of the north and south, so that each
+        # redraw zooms to a new extent.
+        north = slicer.slice_points["dec"] > 0
+        fig = None
+        for in_map in (north, ~north, north):
+            metric_values = np.ma.MaskedArray(self.rng.uniform(size=len(slicer)), mask=~in_map)
+            fig = plotter(metric_values, slicer, plot_dict, fig=fig)
+
+        # Only the last map and the current boundary should remain.
+        ax = plotter.skyproj.ax
+        self.assertEqual(len([c for c in ax.collections if isinstance(c, QuadMesh)]), 1)
+        self.assertEqual(list(ax.lines), list(plotter.skyproj._boundary_lines))
+        self.assertGreater(plotter.skyproj.get_extent()[3], 0)
+
     def test_visit_perimeter_plotter(self):
         model_observatory = ModelObservatory(init_load_length=1)
 
@@ -119,7 +188,8 @@ class TestPlotters(unittest.TestCase):
                 decl - 0.5 * size * np.cos(np.radians(rotation)),
                 decl + 0.5 * size * np.sin(np.radians(rotation)),
             ]
-            return ras, decls
+            # shape should be (n_visits, n_vertices)
+            return np.array(ras).T, np.array(decls).T
 
         plot_dict = {
             "camera_perimeter_func": compute_camera_perimeter,
@@ -131,6 +201,146 @@ class TestPlotters(unittest.TestCase):
         bundle.set_plot_dict(plot_dict)
         _ = bundle.plot()
 
+    def test_visit_perimeter_collection(self):
+        num_points = 5
+        visits = np.rec.fromarrays(
+            (
+                np.linspace(30, 34, num_points),
+                np.linspace(-60, -56, num_points),
+                np.zeros(num_points),
+            ),
+            names="fieldRA,fieldDec,rotSkyPos",
+        )
+
+        def compute_camera_perimeter(ra, decl, rotation):
+            # A square (in R.A. and declination) with a vertex
+            # on each side of R.A.=0, to test de-normalization.
+            ras = np.stack([ra - 0.5, ra + 0.5, ra + 0.5, ra - 0.5], axis=-1) % 360
+            decls = np.stack([decl - 0.5, decl - 0.5, decl + 0.5, decl + 0.5], axis=-1)
+            return ras, decls
+
+        plotter = maf.VisitPerimeterPlotter()
+        plot_dict = {
+            "camera_perimeter_func": compute_camera_perimeter,
+            "draw_polygon_kwargs": {"facecolor": None, "edgecolor": "red"},
+            "decorations": [],
+        }
+        _ = plotter([visits], maf.UniSlicer(), plot_dict)
+
+        # All perimeters should be drawn in a single, unfilled collection.
+        collections = plotter.skyproj.ax.collections
+        self.assertEqual(len(collections), 1)
+        self.assertEqual(len(collections[0].get_paths()), num_points)
+        self.assertTrue(np.all(collections[0].get_facecolor()[:, 3] == 0))
+
+        # Perimeters must have shape (n_visits, n_vertices).
+        def compute_flat_perimeter(ra, decl, rotation):
+            ras, decls = compute_camera_perimeter(ra, decl, rotation)
+            return ras.ravel(), decls.ravel()
+
+        plot_dict["camera_perimeter_func"] = compute_flat_perimeter
+        with self.assertRaises(ValueError):
+            plotter([visits], maf.UniSlicer(), plot_dict)
+
+    def test_skyproj_decorations(self):
+        # A stand-in for ModelObservatory with only what decorate uses.
+        class StubAlmanac:
+            def get_sun_moon_positions(self, mjd):
+                return {
+                    "sun_RA": np.array(np.radians(200.0)),
+                    "sun_dec": np.array(np.radians(-10.0)),
+                    "moon_RA": np.array(np.radians(20.0)),
+                    "moon_dec": np.array(np.radians(10.0)),
+                }
+
+        class StubObservatory:
+            mjd = 60000.0
+            location = SimpleNamespace(lat=SimpleNamespace(deg=-30.2))
+            almanac = StubAlmanac()
+
+            def return_conditions(self):
+                return SimpleNamespace(lmst=5.0)
+
+        plotter = maf.VisitPerimeterPlotter()
+        plot_dict = {
+            "model_observatory": StubObservatory(),
+            "decorations": ["ecliptic", "galactic_plane", "sun", "moon", "horizon"],
+        }
+        # With no visits, only the decorations are drawn.
+        _ = plotter([], maf.UniSlicer(), plot_dict)
+
+        # The ecliptic, galactic plane, and horizon should be drawn
+        # in a single LineCollection.
+        ax = plotter.skyproj.ax
+        line_collections = [c for c in ax.collections if isinstance(c, LineCollection)]
+        self.assertEqual(len(line_collections), 1)
+        np.testing.assert_array_equal(
+            line_collections[0].get_colors(), to_rgba_array(["green", "blue", "black"])
+        )
+        self.assertEqual(line_collections[0].get_linewidths()[2], 3)
+
+        # The sun and moon should be marked with a single scatter plot.
+        point_collections = [c for c in ax.collections if isinstance(c, PathCollection)]
+        self.assertEqual(len(point_collections), 1)
+        self.assertEqual(len(point_collections[0].get_offsets()), 2)
+
+        # Circles with other keyword arguments fall back to draw_circle.
+        with mock.patch.object(plotter, "draw_circle", wraps=plotter.draw_circle) as draw_circle:
+            plotter.draw_circles(
+                [
+                    (10.0, -20.0, 5.0, {"edgecolor": "red"}),
+                    (30.0, -40.0, 5.0, {"edgecolor": "red", "facecolor": "red"}),
+                ]
+            )
+        draw_circle.assert_called_once_with(30.0, -40.0, 5.0, edgecolor="red", facecolor="red")
+        line_collections = [c for c in ax.collections if isinstance(c, LineCollection)]
+        self.assertEqual(len(line_collections), 2)
+        self.assertEqual(len(line_collections[1].get_segments()), 1)
+
+        # The methods for single decorations share the same positions.
+        num_lines = len(ax.lines)
+        plotter.draw_zd(45, edgecolor="red")
+        self.assertGreater(len(ax.lines), num_lines)
+        plotter.draw_body("moon", color="red")
+        np.testing.assert_allclose(ax.collections[-1].get_offsets()[0], point_collections[0].get_offsets()[1])
+
+        # Without a model observatory, both warn rather than draw.
+        plotter.plot_dict["model_observatory"] = None
+        num_artists = len(ax.lines) + len(ax.collections)
+        with self.assertWarns(UserWarning):
+            plotter.draw_zd()
+        with self.assertWarns(UserWarning):
+            plotter.draw_body("sun")
+        with self.assertWarns(UserWarning):
+            plotter.decorate()
+        self.assertEqual(len(ax.lines) + len(ax.collections), num_artists + 1)
+
+    def test_compute_circle_points(self):
+        center_ra, center_decl, radius = 123.4, -30.2, 45.0
+        circle = maf.compute_circle_points(center_ra, center_decl, radius)
+        self.assertEqual(len(circle), 361)
+
+        expected = SkyCoord(center_ra * u.deg, center_decl * u.deg).directional_offset_by(
+            circle.index.values * u.deg, radius * u.deg
+        )
+        np.testing.assert_allclose(circle.decl.values, expected.dec.deg, atol=1e-9)
+        np.testing.assert_allclose(circle.ra.values % 360, expected.ra.deg, atol=1e-9)
+
+        # RA should be de-normalized so there are no large jumps
+        self.assertTrue(np.all(np.abs(np.diff(circle.ra.values)) < 180))
+
+    def test_circle_points_loop(self):
+        # The loop compiled with numba for large circles should match
+        # the numpy implementation, including near the pole and when
+        # the circle crosses R.A.=0.
+        bearings = np.linspace(0.0, 360.0, 721)
+        for center_ra, center_decl, radius in ((123.4, -30.2, 45.0), (10.0, 89.5, 5.0), (359.5, -20.0, 2.0)):
+            loop_ras, loop_decls = _circle_points_loop(center_ra, center_decl, radius, bearings)
+            np_ras, np_decls = _circle_points_np(center_ra, center_decl, radius, bearings)
+            np.testing.assert_allclose(loop_ras, np_ras, atol=1e-9)
+            np.testing.assert_allclose(loop_decls, np_decls, atol=1e-9)
+            self.assertTrue(np.all(np.abs(np.diff(loop_ras)) < 180))
+
 
 if __name__ == "__main__":
     unittest.main()